@@ -3,18 +3,54 @@ Tomato Disease Classifier - FastAPI Server
 Loads weights directly from .h5 file
 """
 import os
+import logging
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 
+# Split the cores between Uvicorn workers so their TF pools don't oversubscribe.
+# The worker count is read from WEB_CONCURRENCY, which `uvicorn --workers N`
+# does not export: set WEB_CONCURRENCY=N alongside it (or instead of it).
+try:
+    WEB_CONCURRENCY = max(1, int(os.environ.get('WEB_CONCURRENCY', 1)))
+except ValueError:
+    raise ValueError(
+        f"WEB_CONCURRENCY must be an integer worker count, got {os.environ['WEB_CONCURRENCY']!r}"
+    ) from None
+INFERENCE_THREADS = max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY)
+# Operator-provided values win
+os.environ.setdefault('TF_ENABLE_ONEDNN_OPTS', '1')
+os.environ.setdefault('OMP_NUM_THREADS', str(INFERENCE_THREADS))
+
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import tensorflow as tf
+tf.config.threading.set_intra_op_parallelism_threads(INFERENCE_THREADS)
+tf.config.threading.set_inter_op_parallelism_threads(1)
 import numpy as np
 from PIL import Image
-import io
 import h5py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+try:
+    import onnxruntime as ort
+    import tf2onnx
+except ImportError:
+    ort = None
+
+# Startup and backend messages go through logging, formatted like uvicorn's
+logger = logging.getLogger('tomato')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(levelname)s:     %(message)s'))
+    logger.addHandler(handler)
 
-print("Building model architecture and loading weights from .h5 file...")
+logger.info("Building model architecture and loading weights from .h5 file...")
 
 # Recreate the exact model architecture (10-class classification)
 model = tf.keras.Sequential([
@@ -32,13 +68,30 @@ model = tf.keras.Sequential([
     tf.keras.layers.Dropout(0.5),
     tf.keras.layers.Dense(128, activation='relu'),
     tf.keras.layers.Dropout(0.3),
-    tf.keras.layers.Dense(10, activation='softmax')
+    # Logits only; softmax is applied per request in analyze_image
+    tf.keras.layers.Dense(10)
 ])
+NUM_PARAMS = int(model.count_params())
+
+# Class names from training
+CLASS_NAMES = (
+    'Bacterial_spot',
+    'Early_blight',
+    'Late_blight',
+    'Leaf_Mold',
+    'Septoria_leaf_spot',
+    'Spider_mites',
+    'Target_Spot',
+    'Yellow_Leaf_Curl_Virus',
+    'Tomato_mosaic_virus',
+    'Healthy',
+)
 
 # Load weights directly from .h5 file
 h5_path = "models/best_tomato_model.h5"
 try:
-    with h5py.File(h5_path, 'r') as f:
+    # Small contiguous datasets read once: no chunk cache needed
+    with h5py.File(h5_path, 'r', rdcc_nbytes=0, libver='latest') as f:
         if 'model_weights' in f:
             weight_group = f['model_weights']
         else:
@@ -49,26 +102,398 @@ try:
         
         for layer in model.layers:
             if layer.name in layer_names:
-                layer_weights = []
                 g = weight_group[layer.name]
                 weight_names = [n.decode('utf8') if hasattr(n, 'decode') else n 
                               for n in g.attrs.get('weight_names', [])]
-                for weight_name in weight_names:
-                    weight = np.array(g[weight_name])
-                    layer_weights.append(weight)
-                if layer_weights:
-                    layer.set_weights(layer_weights)
-
-    print("✅ Model loaded successfully with weights from .h5 file!")
-    print(f"Model input shape: {model.input_shape}")
-    print(f"Model output shape: {model.output_shape}")
-    print(f"Total parameters: {model.count_params():,}")
+                # Read each dataset straight into a buffer and assign it to the
+                # matching variable, skipping set_weights' per-layer validation;
+                # strict zip still raises on a weight count mismatch
+                for variable, weight_name in zip(layer.weights, weight_names, strict=True):
+                    ds = g[weight_name]
+                    buf = np.empty(ds.shape, dtype=ds.dtype)
+                    ds.read_direct(buf)
+                    variable.assign(buf)
+
+    logger.info("✅ Model loaded successfully with weights from .h5 file!")
+    logger.info("Model input shape: %s", model.input_shape)
+    logger.info("Model output shape: %s", model.output_shape)
+    logger.info("Total parameters: %d", NUM_PARAMS)
 except Exception as e:
-    print(f"❌ Error loading model: {e}")
-    print("⚠️  Model will run with random weights for testing")
+    logger.error("❌ Error loading model: %s", e)
+    logger.warning("⚠️  Model will run with random weights for testing")
+
+
+def fold_batchnorm(model):
+    """Fold BatchNormalization layers into the next Dense layer where exact
+
+    Every BN here sits after Conv2D + ReLU, so it cannot be folded back into
+    the conv. It can be folded forward into a Dense kernel when only Flatten,
+    Dropout and (for a positive per-channel scale) MaxPooling2D lie between.
+    The folded model is checked against the original on a random batch, and
+    the fold is undone if their outputs differ.
+    """
+    layers = list(model.layers)
+    sample = np.random.rand(4, *model.input_shape[1:]).astype(np.float32)
+    expected = model(sample, training=False).numpy()
+    folded = []
+    originals = []
+    for i, layer in enumerate(layers):
+        if not isinstance(layer, tf.keras.layers.BatchNormalization):
+            continue
+        scale = layer.gamma.numpy() / np.sqrt(layer.moving_variance.numpy() + layer.epsilon)
+        shift = layer.beta.numpy() - layer.moving_mean.numpy() * scale
+
+        target = None
+        for nxt in layers[i + 1:]:
+            if isinstance(nxt, (tf.keras.layers.Flatten, tf.keras.layers.Dropout)):
+                continue
+            if isinstance(nxt, tf.keras.layers.MaxPooling2D) and np.all(scale > 0):
+                continue
+            if isinstance(nxt, tf.keras.layers.Dense):
+                target = nxt
+            break
+        if target is None:
+            continue
+
+        kernel = target.kernel.numpy()
+        bias = target.bias.numpy()
+        if kernel.shape[0] % scale.size:
+            continue
+        # Flatten keeps channels last, so channel c repeats every scale.size rows
+        reps = kernel.shape[0] // scale.size
+        row_scale = np.tile(scale, reps)
+        row_shift = np.tile(shift, reps)
+        originals.append((target, kernel, bias))
+        target.bias.assign(bias + row_shift @ kernel)
+        target.kernel.assign(kernel * row_scale[:, None])
+        folded.append(layer)
+
+    if not folded:
+        return model
+    folded_model = tf.keras.Sequential(
+        [tf.keras.Input(shape=model.input_shape[1:])]
+        + [layer for layer in layers if all(layer is not bn for bn in folded)]
+    )
+
+    try:
+        np.testing.assert_allclose(
+            folded_model(sample, training=False).numpy(), expected, rtol=1e-3, atol=1e-3
+        )
+    except AssertionError as e:
+        # The Dense layers are shared with the original model; restore them
+        for target, kernel, bias in originals:
+            target.kernel.assign(kernel)
+            target.bias.assign(bias)
+        logger.warning("⚠️  BatchNorm fold changed model outputs, skipping it: %s", e)
+        return model
+    logger.info("✅ Folded %d BatchNormalization layer(s) into Dense", len(folded))
+    return folded_model
+
+
+model = fold_batchnorm(model)
+
+# Trace the forward pass once so requests skip Keras predict() dispatch
+@tf.function(input_signature=[tf.TensorSpec([None, 128, 128, 3], tf.float32)])
+def infer(x):
+    return model(x, training=False)
+
+infer(tf.zeros((1, 128, 128, 3), dtype=tf.float32))
+
+# With a GPU, uploads are decoded and resized per request by the same PIL path
+# as on CPU (so predictions don't depend on the hardware, and one bad upload
+# can't fail a whole batch). Only the uint8 batch crosses to the device, and
+# normalization runs there inside the model graph.
+GPU_AVAILABLE = bool(tf.config.list_physical_devices('GPU'))
+
+
+@tf.function(input_signature=[tf.TensorSpec([None, 128, 128, 3], tf.uint8)])
+def pipeline(uint8_batch):
+    return model(tf.cast(uint8_batch, tf.float32) / 255.0, training=False)
+
+if GPU_AVAILABLE:
+    pipeline(tf.zeros((1, 128, 128, 3), dtype=tf.uint8))
+
+
+def load_image(fileobj):
+    """Decode an uploaded image into a (128, 128, 3) uint8 array"""
+    fileobj.seek(0)
+    img = Image.open(fileobj)
+    img.draft('RGB', (256, 256))  # let libjpeg downscale while decoding
+    img = img.convert('RGB')
+    img = img.resize((128, 128), Image.Resampling.BILINEAR)
+    return np.asarray(img)
+
+
+# Micro-batching: concurrent requests are coalesced into one model call
+MAX_BATCH = 8
+BATCH_WINDOW = 0.005  # seconds to wait for more requests after the first
+REQUEST_TIMEOUT = 30.0
+BATCH_BUF = np.empty((MAX_BATCH, 128, 128, 3), dtype=np.float32)
+
+# Inference backends. Each runner takes a preprocessed (N, 128, 128, 3)
+# float32 batch and returns logits. Only the one named by INFERENCE_BACKEND
+# (default DEFAULT_BACKEND) is built. BENCHMARK_BACKENDS=1 builds and times all
+# of them instead and serves the fastest; run it in a single process, since
+# workers benchmarking side by side skew each other.
+DEFAULT_BACKEND = 'tflite-float16'
+BENCHMARK_BACKENDS = os.environ.get("BENCHMARK_BACKENDS") == '1'
+INPUT_SCALE = np.float32(1.0 / 255.0)
+CALIBRATION_DIR = os.environ.get("CALIBRATION_DIR")
+
+
+def make_onnx_runner():
+    """Export the model to ONNX in memory and wrap an ONNX Runtime session
+
+    Exports the traced tf.function rather than the Keras model, since
+    tf2onnx's from_keras predates Keras 3.
+    """
+    model_proto, _ = tf2onnx.convert.from_function(
+        infer,
+        input_signature=[tf.TensorSpec((None, 128, 128, 3), tf.float32, name='input')],
+        opset=17,
+    )
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if 'XnnpackExecutionProvider' in ort.get_available_providers():
+        # XNNPACK runs its own thread pool; ORT's intra-op pool would compete
+        # with it for the same cores
+        options.intra_op_num_threads = 1
+        options.add_session_config_entry('session.intra_op.allow_spinning', '0')
+        providers = [
+            ('XnnpackExecutionProvider', {'intra_op_num_threads': str(INFERENCE_THREADS)}),
+            'CPUExecutionProvider',
+        ]
+    else:
+        options.intra_op_num_threads = INFERENCE_THREADS
+        providers = ['CPUExecutionProvider']
+    session = ort.InferenceSession(model_proto.SerializeToString(), options, providers=providers)
+    input_name = session.get_inputs()[0].name
+
+    def run(batch):
+        return session.run(None, {input_name: batch})[0]
+    return run
+
+
+def representative_dataset():
+    """Yield up to 100 preprocessed images from CALIBRATION_DIR for int8"""
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(CALIBRATION_DIR)
+        for name in names
+        if name.lower().endswith(('.jpg', '.jpeg', '.png'))
+    )
+    for path in paths[:100]:
+        with open(path, 'rb') as f:
+            yield [(load_image(f) * INPUT_SCALE)[None]]
+
+
+def load_xnnpack_delegate():
+    """Load a new external XNNPACK delegate, or None to use TFLite's built-in one
+
+    Delegates are per-interpreter, and the external one does not inherit the
+    interpreter's num_threads, so each call creates its own with the count set.
+    """
+    try:
+        return [tf.lite.experimental.load_delegate(
+            'libxnnpack_delegate.so', options={'num_threads': INFERENCE_THREADS}
+        )]
+    except (ValueError, OSError):
+        return None
+
+
+def make_tflite_runner(quantization):
+    """Convert the model to an in-memory TFLite FlatBuffer and wrap an interpreter
+
+    Nothing is written to disk, so several Uvicorn workers never rewrite a
+    file another one has memory-mapped, and read-only deploys work.
+    """
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if quantization == 'float16':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == 'int8':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    interpreter = tf.lite.Interpreter(
+        model_content=converter.convert(),
+        num_threads=INFERENCE_THREADS,
+        experimental_delegates=load_xnnpack_delegate(),
+    )
+    interpreter.allocate_tensors()
+    input_index = interpreter.get_input_details()[0]['index']
+    output_index = interpreter.get_output_details()[0]['index']
+    batch_size = 1
+
+    def run(batch):
+        nonlocal batch_size
+        if batch.shape[0] != batch_size:
+            interpreter.resize_tensor_input(input_index, batch.shape)
+            interpreter.allocate_tensors()
+            batch_size = batch.shape[0]
+        interpreter.set_tensor(input_index, batch)
+        interpreter.invoke()
+        return interpreter.get_tensor(output_index)
+    return run
+
+
+def make_tf_runner():
+    """Wrap the traced tf.function"""
+    def run(batch):
+        return infer(tf.constant(batch, dtype=tf.float32)).numpy()
+    return run
+
+
+def benchmark(run, iterations=5):
+    """Mean seconds per image over the batch sizes the micro-batcher produces
+
+    Sizes are cycled so a runner's cost of switching batch size (TFLite's
+    resize and re-allocate) is part of the timing.
+    """
+    batch_sizes = (1, 2, 4, MAX_BATCH)
+    samples = {n: np.random.rand(n, 128, 128, 3).astype(np.float32) for n in batch_sizes}
+    for n in batch_sizes:
+        run(samples[n])
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for n in batch_sizes:
+            run(samples[n])
+    return (time.perf_counter() - start) / (iterations * sum(batch_sizes))
+
+
+def select_backend():
+    """Build the configured CPU backend (or benchmark all) and return its runner"""
+    backend_factories = {}
+    if ort is not None:
+        backend_factories['onnx'] = make_onnx_runner
+    backend_factories['tflite-float32'] = lambda: make_tflite_runner('float32')
+    backend_factories['tflite-float16'] = lambda: make_tflite_runner('float16')
+    if CALIBRATION_DIR:
+        backend_factories['tflite-int8'] = lambda: make_tflite_runner('int8')
+    backend_factories['tf'] = make_tf_runner
+
+    requested_backend = os.environ.get("INFERENCE_BACKEND", DEFAULT_BACKEND)
+    if requested_backend not in backend_factories:
+        logger.warning("⚠️  INFERENCE_BACKEND=%s is not available here (choices: %s); using %s",
+                       requested_backend, ", ".join(backend_factories), DEFAULT_BACKEND)
+        requested_backend = DEFAULT_BACKEND
+
+    if BENCHMARK_BACKENDS:
+        logger.info("Benchmarking inference backends...")
+        candidates = backend_factories
+    else:
+        candidates = {requested_backend: backend_factories[requested_backend]}
+
+    best_name, best_runner, best_time = None, None, float('inf')
+    for name, factory in candidates.items():
+        try:
+            runner = factory()
+            elapsed = benchmark(runner) if BENCHMARK_BACKENDS else 0.0
+        except Exception as e:
+            logger.error("❌ Error preparing %s backend: %s", name, e)
+            continue
+        if BENCHMARK_BACKENDS:
+            logger.info("   %s: %.2f ms/image", name, elapsed * 1000)
+        # Keep only the fastest runner so the losers' sessions can be freed
+        if elapsed < best_time:
+            best_name, best_runner, best_time = name, runner, elapsed
+        runner = None
+
+    if best_runner is None:
+        logger.warning("⚠️  No backend could be prepared; falling back to tf")
+        best_name, best_runner = 'tf', make_tf_runner()
+    return best_name, best_runner
+
+
+if GPU_AVAILABLE:
+    # predict_batch always goes through the GPU pipeline, so no CPU backend
+    # is built
+    if "INFERENCE_BACKEND" in os.environ or BENCHMARK_BACKENDS:
+        logger.warning("⚠️  GPU found: INFERENCE_BACKEND/BENCHMARK_BACKENDS are ignored")
+    INFERENCE_BACKEND, run_inference = 'gpu-pipeline', None
+    logger.info("✅ Serving with the uint8 GPU pipeline")
+else:
+    INFERENCE_BACKEND, run_inference = select_backend()
+    logger.info("✅ Serving with %s backend", INFERENCE_BACKEND)
+
+
+# Decoding runs on POOL so the event loop keeps accepting uploads. Inference
+# gets its own single thread: only one batch is in flight, the backend already
+# uses INFERENCE_THREADS intra-op threads, and decoding must not queue behind it.
+POOL = ThreadPoolExecutor(max_workers=INFERENCE_THREADS)
+INFERENCE_POOL = ThreadPoolExecutor(max_workers=1)
+
+
+def predict_batch(arrays):
+    """Normalize uint8 images into the float32 batch buffer and predict
+
+    On a GPU the uint8 batch is normalized on the device instead.
+    """
+    if GPU_AVAILABLE:
+        return pipeline(np.stack(arrays)).numpy()
+    batch = BATCH_BUF[:len(arrays)]
+    for row, arr in zip(batch, arrays):
+        np.multiply(arr, INPUT_SCALE, out=row, casting='unsafe')
+    return run_inference(batch)
+
+
+# Created by the app lifespan; None outside a running server
+batch_queue = None
+
+
+async def batch_worker():
+    """Collect queued images for up to BATCH_WINDOW and predict them together"""
+    loop = asyncio.get_running_loop()
+    while True:
+        items = [await batch_queue.get()]
+        deadline = loop.time() + BATCH_WINDOW
+        while len(items) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            predictions = await loop.run_in_executor(
+                INFERENCE_POOL, predict_batch, [arr for arr, _ in items]
+            )
+        except Exception as e:
+            for _, fut in items:
+                if not fut.done():
+                    fut.set_exception(e)
+            continue
+
+        for (_, fut), prediction in zip(items, predictions):
+            if not fut.done():
+                fut.set_result(prediction)
+
+@asynccontextmanager
+async def lifespan(app):
+    """Run the batch worker for the lifetime of the server"""
+    global batch_queue
+    batch_queue = asyncio.Queue()
+    batch_task = asyncio.create_task(batch_worker())
+    try:
+        yield
+    finally:
+        batch_task.cancel()
+        try:
+            await batch_task
+        except asyncio.CancelledError:
+            pass
+        batch_queue = None
 
 # FastAPI app
-app = FastAPI(title="Tomato Disease Classifier API")
+# Endpoints return ORJSONResponse themselves: FastAPI runs jsonable_encoder on
+# returned dicts even when the default response class is ORJSONResponse
+app = FastAPI(
+    title="Tomato Disease Classifier API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # CORS
 app.add_middleware(
@@ -81,7 +506,7 @@ app.add_middleware(
 
 @app.get("/")
 def root():
-    return {
+    return ORJSONResponse({
         "message": "🍅 Tomato Disease Classifier API",
         "model_source": "tomato_leaf_cnn_model.h5",
         "endpoints": {
@@ -91,18 +516,18 @@ def root():
         "model_info": {
             "input_shape": str(model.input_shape),
             "output_shape": str(model.output_shape),
-            "parameters": int(model.count_params())
+            "parameters": NUM_PARAMS
         }
-    }
+    })
 
 @app.get("/health")
 def health_check():
-    return {
+    return ORJSONResponse({
         "status": "healthy",
         "model_loaded": True,
-        "model_params": int(model.count_params()),
+        "model_params": NUM_PARAMS,
         "model_source": "h5_weights"
-    }
+    })
 
 @app.post("/api/analyze")
 async def analyze_image(file: UploadFile = File(...)):
@@ -113,62 +538,54 @@ async def analyze_image(file: UploadFile = File(...)):
         if not file.content_type.startswith('image/'):
             raise HTTPException(status_code=400, detail="File must be an image")
         
-        # Read and preprocess
-        contents = await file.read()
-        img = Image.open(io.BytesIO(contents))
-        img = img.convert('RGB')
-        img = img.resize((128, 128))
+        # Decode straight from the spooled upload file, no extra bytes copy
+        loop = asyncio.get_running_loop()
+        arr = await loop.run_in_executor(POOL, load_image, file.file)
         
-        # Normalize
-        img_array = np.array(img) / 255.0
-        img_array = np.expand_dims(img_array, axis=0)
+        # Queue for the batch worker and wait for this image's prediction
+        # (10-class classification)
+        if batch_queue is None:
+            raise RuntimeError("Batch worker is not running (app lifespan not started)")
+        fut = loop.create_future()
+        await batch_queue.put((arr, fut))
+        try:
+            logits = await asyncio.wait_for(fut, REQUEST_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=504,
+                detail=f"Timed out after {REQUEST_TIMEOUT:g}s waiting for a prediction",
+            )
+        predicted_class = int(logits.argmax())
         
-        # Predict (10-class classification)
-        prediction = model.predict(img_array, verbose=0)
-        predicted_class = int(np.argmax(prediction[0]))
-        confidence = float(np.max(prediction[0])) * 100
+        # Stable softmax in float64 so the rounded values serialize as
+        # e.g. 12.34, not 12.3400001
+        exp = np.exp(logits.astype(np.float64) - logits[predicted_class])
+        scaled = np.round(exp * (100 / exp.sum()), 2)
+        confidence = float(scaled[predicted_class])
         
-        # Class names from training
-        class_names = [
-            'Bacterial_spot',
-            'Early_blight', 
-            'Late_blight',
-            'Leaf_Mold',
-            'Septoria_leaf_spot',
-            'Spider_mites',
-            'Target_Spot',
-            'Yellow_Leaf_Curl_Virus',
-            'Tomato_mosaic_virus',
-            'Healthy'
-        ]
-        
-        disease_name = class_names[predicted_class]
+        disease_name = CLASS_NAMES[predicted_class]
         is_healthy = (disease_name == 'Healthy')
         
-        return {
+        return ORJSONResponse({
             "disease": disease_name,
-            "confidence": round(confidence, 2),
+            "confidence": confidence,
             "is_healthy": is_healthy,
             "predicted_class_index": predicted_class,
-            "all_probabilities": {
-                class_names[i]: round(float(prediction[0][i]) * 100, 2) 
-                for i in range(len(class_names))
-            },
+            "all_probabilities": dict(zip(CLASS_NAMES, scaled.tolist())),
             "message": "Analysis complete",
             "model_source": "best_tomato_model.h5 (trained)"
-        }
+        })
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
-    print("\n" + "="*60)
-    print("🍅 TOMATO DISEASE CLASSIFIER API")
-    print("="*60)
-    print(f"Server: http://localhost:{port}")
-    print(f"Docs: http://localhost:{port}/docs")
-    print("Model: tomato_leaf_cnn_model.h5 (direct weights)")
-    print("="*60)
+    logger.info("🍅 TOMATO DISEASE CLASSIFIER API")
+    logger.info("Server: http://localhost:%d", port)
+    logger.info("Docs: http://localhost:%d/docs", port)
+    logger.info("Model: tomato_leaf_cnn_model.h5 (direct weights)")
     uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
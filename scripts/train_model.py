@@ -7,8 +7,7 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 
 import tensorflow as tf
 from tensorflow import keras
-from tensorflow.keras import layers, models
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
+from tensorflow.keras import layers, models, mixed_precision
 from tensorflow.keras.callbacks import ModelCheckpoint, EarlyStopping, ReduceLROnPlateau
 import numpy as np
 import time
@@ -36,8 +35,26 @@ CONFIG = {
     'epochs': 10,  # Reduced from 50 to 10 (~30 minutes)
     'learning_rate': 0.001,
     'validation_split': 0.2,
+    'cpu_mixed_bfloat16': False,  # Only worth it on CPUs with AMX/AVX512-BF16
+    # 'cnn' (the from-scratch architecture main.py rebuilds) or
+    # 'mobilenet_v3_small' (frozen ImageNet backbone, not servable by main.py)
+    'backbone': 'cnn',
+    'fine_tune_epochs': 5,  # Then unfreeze the top of the backbone (0 to skip)
+    'fine_tune_layers': 30,
+    'fine_tune_learning_rate': 1e-4,
 }
 
+# ============================================
+# MIXED PRECISION
+# ============================================
+# float16 compute on GPU tensor cores, float32 master weights. Keras wraps the
+# optimizer in a LossScaleOptimizer automatically under this policy.
+if tf.config.list_physical_devices('GPU'):
+    mixed_precision.set_global_policy('mixed_float16')
+elif CONFIG['cpu_mixed_bfloat16']:
+    mixed_precision.set_global_policy('mixed_bfloat16')
+print(f"Precision policy: {mixed_precision.global_policy().name}")
+
 # ============================================
 # BUILD MODEL
 # ============================================
@@ -68,76 +85,124 @@ def build_model(num_classes):
         layers.Dense(128, activation='relu'),
         layers.Dropout(0.3),
         
-        # Output layer
-        layers.Dense(num_classes, activation='softmax' if num_classes > 2 else 'sigmoid')
+        # Output layer (float32 keeps softmax and the loss numerically stable)
+        layers.Dense(num_classes, activation='softmax' if num_classes > 2 else 'sigmoid',
+                     dtype='float32')
     ])
     
     return model
 
+def build_transfer_model(num_classes):
+    """Build a classifier head on a frozen ImageNet MobileNetV3Small backbone"""
+    input_shape = (CONFIG['img_height'], CONFIG['img_width'], 3)
+    base_model = keras.applications.MobileNetV3Small(
+        input_shape=input_shape,
+        include_top=False,
+        weights='imagenet',
+        minimalistic=True,
+        include_preprocessing=False,
+    )
+    base_model.trainable = False
+    
+    inputs = keras.Input(shape=input_shape)
+    # The pipeline yields [0, 1]; MobileNetV3 expects [-1, 1]
+    x = layers.Rescaling(2.0, offset=-1.0)(inputs)
+    # training=False keeps the backbone's BatchNorm in inference mode, also
+    # once its top layers are unfrozen for fine-tuning
+    x = base_model(x, training=False)
+    x = layers.GlobalAveragePooling2D()(x)
+    x = layers.Dropout(0.3)(x)
+    outputs = layers.Dense(num_classes, activation='softmax' if num_classes > 2 else 'sigmoid',
+                           dtype='float32')(x)
+    
+    return models.Model(inputs, outputs), base_model
+
 # ============================================
 # DATA LOADING
 # ============================================
 print("\n📁 Loading dataset...")
 
-# Data augmentation for training
-train_datagen = ImageDataGenerator(
-    rescale=1./255,
-    rotation_range=20,
-    width_shift_range=0.2,
-    height_shift_range=0.2,
-    shear_range=0.2,
-    zoom_range=0.2,
-    horizontal_flip=True,
-    fill_mode='nearest',
-    validation_split=0.2  # Use 20% for validation
-)
-
-# Only rescaling for validation
-val_datagen = ImageDataGenerator(
-    rescale=1./255,
-    validation_split=0.2
-)
+AUTOTUNE = tf.data.AUTOTUNE
+
+def load_split(subset):
+    """Load one split of the train directory, cached as uint8 after decoding"""
+    ds = tf.keras.utils.image_dataset_from_directory(
+        os.path.join(CONFIG['data_dir'], 'train'),
+        label_mode='categorical',  # or 'binary' for 2 classes
+        image_size=(CONFIG['img_height'], CONFIG['img_width']),
+        batch_size=None,
+        validation_split=CONFIG['validation_split'],
+        subset=subset,
+        seed=42,
+    )
+    samples = len(ds.file_paths)
+    names = ds.class_names
+    ds = ds.map(lambda x, y: (tf.saturate_cast(tf.round(x), tf.uint8), y), num_parallel_calls=AUTOTUNE).cache()
+    return ds, samples, names
+
+# Data augmentation for training (runs batched inside the tf.data pipeline).
+# Pinned to float32 so the mixed precision policy doesn't make it run in
+# float16 on the CPU or hand the model float16 batches.
+augment = keras.Sequential([
+    layers.RandomFlip('horizontal', dtype='float32'),
+    layers.RandomRotation(20 / 360, fill_mode='nearest', dtype='float32'),
+    layers.RandomTranslation(0.2, 0.2, fill_mode='nearest', dtype='float32'),
+    layers.RandomZoom(0.2, fill_mode='nearest', dtype='float32'),
+])
+
+def rescale(x, y):
+    return tf.cast(x, tf.float32) / 255.0, y
 
 # Load training data
-train_generator = train_datagen.flow_from_directory(
-    os.path.join(CONFIG['data_dir'], 'train'),
-    target_size=(CONFIG['img_height'], CONFIG['img_width']),
-    batch_size=CONFIG['batch_size'],
-    class_mode='categorical',  # or 'binary' for 2 classes
-    subset='training',
-    shuffle=True
+train_ds, train_samples, class_names = load_split('training')
+train_ds = (
+    train_ds
+    .shuffle(1000, seed=42)
+    .batch(CONFIG['batch_size'])
+    .map(rescale, num_parallel_calls=AUTOTUNE)
+    .map(lambda x, y: (augment(x, training=True), y), num_parallel_calls=AUTOTUNE)
+    .prefetch(AUTOTUNE)
 )
 
-# Load validation data
-validation_generator = val_datagen.flow_from_directory(
-    os.path.join(CONFIG['data_dir'], 'train'),
-    target_size=(CONFIG['img_height'], CONFIG['img_width']),
-    batch_size=CONFIG['batch_size'],
-    class_mode='categorical',
-    subset='validation',
-    shuffle=False
+# Load validation data (only rescaling)
+validation_ds, validation_samples, _ = load_split('validation')
+validation_ds = (
+    validation_ds
+    .batch(CONFIG['batch_size'])
+    .map(rescale, num_parallel_calls=AUTOTUNE)
+    .prefetch(AUTOTUNE)
 )
 
 # Get class information
-num_classes = len(train_generator.class_indices)
-class_names = list(train_generator.class_indices.keys())
+num_classes = len(class_names)
 
 print(f"\n✅ Dataset loaded successfully!")
 print(f"   Classes found: {num_classes}")
 print(f"   Class names: {class_names}")
-print(f"   Training samples: {train_generator.samples}")
-print(f"   Validation samples: {validation_generator.samples}")
+print(f"   Training samples: {train_samples}")
+print(f"   Validation samples: {validation_samples}")
 
 # ============================================
 # BUILD AND COMPILE MODEL
 # ============================================
 print("\n🏗️  Building model...")
-model = build_model(num_classes)
+if CONFIG['backbone'] == 'mobilenet_v3_small':
+    model, base_model = build_transfer_model(num_classes)
+else:
+    model, base_model = build_model(num_classes), None
+
+# main.py loads best_tomato_model.h5 into the 'cnn' architecture, so other
+# backbones checkpoint to their own file instead of overwriting it
+if CONFIG['backbone'] == 'cnn':
+    checkpoint_path = 'best_tomato_model.h5'
+else:
+    checkpoint_path = f"best_tomato_{CONFIG['backbone']}.h5"
 
 # Compile model
+loss = 'categorical_crossentropy' if num_classes > 2 else 'binary_crossentropy'
 model.compile(
     optimizer=keras.optimizers.Adam(learning_rate=CONFIG['learning_rate']),
-    loss='categorical_crossentropy' if num_classes > 2 else 'binary_crossentropy',
+    loss=loss,
     metrics=['accuracy']
 )
 
@@ -154,7 +219,7 @@ print(f"\n   Total parameters: {total_params:,}")
 callbacks = [
     # Save best model
     ModelCheckpoint(
-        'best_tomato_model.h5',
+        checkpoint_path,
         monitor='val_accuracy',
         save_best_only=True,
         verbose=1
@@ -184,11 +249,11 @@ callbacks = [
 print("\n⏱️  TIME ESTIMATION:")
 print(f"   Batch size: {CONFIG['batch_size']}")
 print(f"   Total epochs: {CONFIG['epochs']}")
-print(f"   Steps per epoch: {train_generator.samples // CONFIG['batch_size']}")
-print(f"   Validation steps: {validation_generator.samples // CONFIG['batch_size']}")
+print(f"   Steps per epoch: {train_samples // CONFIG['batch_size']}")
+print(f"   Validation steps: {validation_samples // CONFIG['batch_size']}")
 
 # Estimate time based on hardware
-steps_per_epoch = train_generator.samples // CONFIG['batch_size']
+steps_per_epoch = train_samples // CONFIG['batch_size']
 if tf.config.list_physical_devices('GPU'):
     time_per_epoch = 30  # ~30 seconds with GPU
     print(f"\n   🚀 GPU DETECTED - Fast training!")
@@ -214,13 +279,37 @@ start_time = time.time()
 
 # Train model
 history = model.fit(
-    train_generator,
+    train_ds,
     epochs=CONFIG['epochs'],
-    validation_data=validation_generator,
+    validation_data=validation_ds,
     callbacks=callbacks,
     verbose=1
 )
 
+# Fine-tune the top of the backbone at a low learning rate
+if base_model is not None and CONFIG['fine_tune_epochs']:
+    print("\n🔧 Fine-tuning top backbone layers...")
+    base_model.trainable = True
+    for layer in base_model.layers[:-CONFIG['fine_tune_layers']]:
+        layer.trainable = False
+    
+    model.compile(
+        optimizer=keras.optimizers.Adam(learning_rate=CONFIG['fine_tune_learning_rate']),
+        loss=loss,
+        metrics=['accuracy']
+    )
+    initial_epoch = len(history.epoch)
+    fine_tune_history = model.fit(
+        train_ds,
+        epochs=initial_epoch + CONFIG['fine_tune_epochs'],
+        initial_epoch=initial_epoch,
+        validation_data=validation_ds,
+        callbacks=callbacks,
+        verbose=1
+    )
+    for key, values in fine_tune_history.history.items():
+        history.history.setdefault(key, []).extend(values)
+
 # Calculate training time
 end_time = time.time()
 training_time = end_time - start_time
@@ -320,7 +409,7 @@ print("\n" + "="*60)
 print("✅ TRAINING COMPLETE!")
 print("="*60)
 print("\n📁 Generated files:")
-print("   1. best_tomato_model.h5 (best model during training)")
+print(f"   1. {checkpoint_path} (best model during training)")
 print("   2. tomato_disease_classifier_final.h5 (final model)")
 print("   3. tomato_disease_classifier_weights.h5 (weights only)")
 print("   4. training_info.json (training metrics)")
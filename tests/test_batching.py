@@ -0,0 +1,113 @@
+"""
+Tests for the /api/analyze micro-batcher
+Runs the app in-process with TestClient, with the model call stubbed out
+"""
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("INFERENCE_BACKEND", "tf")  # skip TFLite conversion on import
+
+from fastapi.testclient import TestClient
+import main
+
+
+def make_upload(class_index):
+    """Solid-color PNG whose red channel encodes the class it should predict"""
+    img = Image.new('RGB', (64, 64), (class_index * 20, 0, 0))
+    buf = io.BytesIO()
+    img.save(buf, format='PNG')
+    return buf.getvalue()
+
+
+def fake_inference(calls):
+    """Model stub: one-hot logits decoded from each row's red channel"""
+    def run(batch):
+        calls.append(len(batch))
+        classes = np.rint(batch[:, 0, 0, 0] * 255 / 20).astype(int)
+        return np.eye(10, dtype=np.float32)[classes] * 10
+    return run
+
+
+def post_concurrently(client, classes):
+    def post(class_index):
+        files = {'file': (f"{class_index}.png", make_upload(class_index), 'image/png')}
+        return client.post("/api/analyze", files=files)
+
+    with ThreadPoolExecutor(max_workers=len(classes)) as pool:
+        return list(pool.map(post, classes))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "GPU_AVAILABLE", False)
+    # A wide window so concurrent uploads land in the same batch
+    monkeypatch.setattr(main, "BATCH_WINDOW", 0.2)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_lifespan_starts_and_stops_batch_worker():
+    assert main.batch_queue is None
+    with TestClient(main.app):
+        assert main.batch_queue is not None
+    assert main.batch_queue is None
+
+
+def test_concurrent_uploads_are_batched_and_routed_back(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "run_inference", fake_inference(calls))
+
+    classes = [0, 3, 5, 7, 9, 2]
+    responses = post_concurrently(client, classes)
+
+    assert sum(calls) == len(classes)
+    assert max(calls) > 1
+    for class_index, response in zip(classes, responses):
+        assert response.status_code == 200
+        result = response.json()
+        assert result['predicted_class_index'] == class_index
+        assert result['disease'] == main.CLASS_NAMES[class_index]
+        assert result['confidence'] > 99
+
+
+def test_failing_batch_fails_every_request_in_it(client, monkeypatch):
+    calls = []
+
+    def broken(batch):
+        calls.append(len(batch))
+        raise ValueError("model exploded")
+
+    monkeypatch.setattr(main, "run_inference", broken)
+
+    responses = post_concurrently(client, [1, 2, 3, 4])
+
+    assert sum(calls) == 4
+    assert max(calls) > 1
+    for response in responses:
+        assert response.status_code == 500
+        assert "model exploded" in response.json()['detail']
+
+
+def test_prediction_timeout_returns_504(client, monkeypatch):
+    def slow(batch):
+        time.sleep(0.5)
+        return np.zeros((len(batch), 10), dtype=np.float32)
+
+    monkeypatch.setattr(main, "run_inference", slow)
+    monkeypatch.setattr(main, "REQUEST_TIMEOUT", 0.05)
+
+    response = client.post(
+        "/api/analyze", files={'file': ('leaf.png', make_upload(1), 'image/png')}
+    )
+
+    assert response.status_code == 504
+    assert "Timed out" in response.json()['detail']
@@ -18,6 +18,10 @@ print("="*70)
 print("🧪 TESTING TRAINED MODEL - MULTIPLE DISEASE CLASSES")
 print("="*70)
 
+# Reuse one keep-alive connection for every upload
+session = requests.Session()
+session.headers.update({'Connection': 'keep-alive'})
+
 correct = 0
 total = 0
 
@@ -33,9 +37,9 @@ for test_dir in test_dirs:
             print(f"   📸 Image: {test_image.name}")
             
             try:
-                with open(test_image, 'rb') as f:
-                    files = {'file': (test_image.name, f, 'image/jpeg')}
-                    response = requests.post("http://localhost:8000/api/analyze", files=files)
+                data = test_image.read_bytes()
+                files = {'file': (test_image.name, data, 'image/jpeg')}
+                response = session.post("http://localhost:8000/api/analyze", files=files)
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -16,10 +16,14 @@ print("="*60)
 print("🧪 TESTING NEWLY TRAINED MODEL")
 print("="*60)
 
+# Reuse one keep-alive connection for every request
+session = requests.Session()
+session.headers.update({'Connection': 'keep-alive'})
+
 # Test health endpoint
 print("\n1️⃣ Testing health endpoint...")
 try:
-    response = requests.get("http://localhost:8000/health")
+    response = session.get("http://localhost:8000/health")
     print(f"✅ Status: {response.status_code}")
     print(f"Response: {response.json()}")
 except Exception as e:
@@ -40,9 +44,9 @@ for test_dir in test_image_dirs:
             print(f"   Image: {test_image.name}")
             
             try:
-                with open(test_image, 'rb') as f:
-                    files = {'file': (test_image.name, f, 'image/jpeg')}
-                    response = requests.post("http://localhost:8000/api/analyze", files=files)
+                data = test_image.read_bytes()
+                files = {'file': (test_image.name, data, 'image/jpeg')}
+                response = session.post("http://localhost:8000/api/analyze", files=files)
                 
                 if response.status_code == 200:
                     result = response.json()